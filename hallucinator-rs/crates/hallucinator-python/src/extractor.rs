@@ -286,3 +286,14 @@ impl PyPdfExtractor {
         "NativePdfExtractor(...)".to_string()
     }
 }
+
+/// Clean an extracted title by removing trailing venue/metadata.
+///
+/// This is the native title cleanup the extractor applies, including the
+/// venue-leak cuts after ``?``/``!``. Pass ``from_quotes=True`` for titles
+/// taken from quotation marks, which are not cut at the first sentence end.
+#[pyfunction]
+#[pyo3(signature = (title, from_quotes=false))]
+pub fn clean_title(title: &str, from_quotes: bool) -> String {
+    hallucinator_parsing::title::clean_title(title, from_quotes)
+}
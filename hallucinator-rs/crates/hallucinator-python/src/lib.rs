@@ -16,6 +16,7 @@ fn _native(m: &Bound<'_, PyModule>) -> PyResult<()> {
     m.add_class::<types::PyReference>()?;
     m.add_class::<types::PyExtractionResult>()?;
     m.add_class::<types::PySkipStats>()?;
+    m.add_function(wrap_pyfunction!(extractor::clean_title, m)?)?;
 
     // Archive extraction
     m.add_class::<archive::PyArchiveEntry>()?;
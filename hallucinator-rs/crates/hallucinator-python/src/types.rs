@@ -3,7 +3,7 @@ use pyo3::prelude::*;
 use hallucinator_core::{ExtractionResult, Reference, SkipStats};
 
 /// A parsed reference extracted from a document.
-#[pyclass(name = "Reference")]
+#[pyclass(name = "Reference", frozen)]
 #[derive(Debug, Clone)]
 pub struct PyReference {
     inner: Reference,
@@ -8,6 +8,9 @@ This addresses the use case from issue #178 — validating references when
 you already have titles, authors, and DOIs without needing a PDF.
 """
 
+import logging
+import sys
+
 from hallucinator import Reference, Validator, ValidatorConfig
 
 # Build references from structured data — no PDF needed.
@@ -29,21 +32,60 @@ refs = [
 
 # Configure and validate
 config = ValidatorConfig()
+# References are checked concurrently; each check is mostly waiting on
+# database round-trips, so more workers than cores is fine. Results still
+# come back in input order.
+config.num_workers = 8
+# Persist lookups across runs, so re-validating the same references is
+# served from disk instead of the network (entries expire after a TTL).
+config.cache_path = ".hallucinator_cache.sqlite"
 validator = Validator(config)
 
 
+# Progress goes through logging, so a message is only formatted when its
+# level is enabled. Set the level to WARNING to silence per-reference output.
+logging.basicConfig(level=logging.INFO, format="%(message)s", stream=sys.stdout)
+logger = logging.getLogger("hallucinator.validator")
+
+ICONS = {"verified": "+", "not_found": "?", "author_mismatch": "~"}
+
+
 def on_progress(event):
     if event.event_type == "checking":
-        print(f"  [{event.index + 1}/{event.total}] Checking: {event.title}")
+        logger.info("  [%d/%d] Checking: %s", event.index + 1, event.total, event.title)
     elif event.event_type == "result":
         r = event.result
-        icon = {"verified": "+", "not_found": "?", "author_mismatch": "~"}[r.status]
-        src = f" ({r.source})" if r.source else ""
-        print(f"  [{icon}] {r.title}{src}")
+        if r.source:
+            logger.info("  [%s] %s (%s)", ICONS[r.status], r.title, r.source)
+        else:
+            logger.info("  [%s] %s", ICONS[r.status], r.title)
+
+
+def dedupe(refs):
+    """Collapse repeated references (e.g. from merged bibliographies).
+
+    Returns the unique references and, for each input reference, the index
+    of its unique representative, so each duplicate costs no extra lookups.
+    """
+    seen = {}
+    unique = []
+    mapping = []
+    for ref in refs:
+        # Whitespace-collapsed, case-folded title, interned so repeats of a
+        # title share one string
+        title = sys.intern(" ".join((ref.title or ref.raw_citation).casefold().split()))
+        key = (title, ref.authors[0] if ref.authors else None)
+        if key not in seen:
+            seen[key] = len(unique)
+            unique.append(ref)
+        mapping.append(seen[key])
+    return unique, mapping
 
 
-print(f"Validating {len(refs)} references...\n")
-results = validator.check(refs, progress=on_progress)
+unique_refs, mapping = dedupe(refs)
+print(f"Validating {len(unique_refs)} unique references...\n")
+unique_results = validator.check(unique_refs, progress=on_progress)
+results = [unique_results[i] for i in mapping]
 
 # Summary
 stats = Validator.stats(results)
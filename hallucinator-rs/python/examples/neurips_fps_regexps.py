@@ -22,7 +22,10 @@ Run this file to test all patterns:
 """
 
 import re
-from typing import Optional, List, Tuple
+from bisect import bisect_right
+from functools import lru_cache
+from itertools import accumulate
+from typing import Final, Optional, List, Tuple
 
 
 # =============================================================================
@@ -53,13 +56,36 @@ def truncate_title_at_venue(title: str) -> str:
 
     Returns the truncated title (keeping the ?/!) or original if no venue found.
     """
+    # The pattern needs a ?/!, and most titles have neither
+    if '?' not in title and '!' not in title:
+        return title
     match = VENUE_AFTER_PUNCTUATION_PATTERN.search(title)
     if match:
-        # Keep everything up to and including the ?/!
-        return title[:match.start() + 1].strip()
+        # Keep everything up to and including the ?/!; the slice ends on
+        # that character, so only leading whitespace can need stripping
+        return title[:match.start() + 1].lstrip()
     return title
 
 
+def truncate_titles_at_venue(titles: List[str]) -> List[str]:
+    """Batch form of truncate_title_at_venue, e.g. for all titles of a paper.
+
+    The titles are joined with NUL, which no part of the pattern can match,
+    so a single finditer pass finds every title's first venue leak without
+    matches running across titles.
+    """
+    joined = '\0'.join(titles)
+    starts = list(accumulate((len(t) + 1 for t in titles[:-1]), initial=0))
+    truncated = list(titles)
+    last = -1
+    for match in VENUE_AFTER_PUNCTUATION_PATTERN.finditer(joined):
+        i = bisect_right(starts, match.start()) - 1
+        if i != last:  # Only the first match in a title counts
+            truncated[i] = joined[starts[i]:match.start() + 1].lstrip()
+            last = i
+    return truncated
+
+
 def test_venue_after_punctuation():
     """Test venue-after-punctuation truncation."""
     print("=" * 60)
@@ -89,6 +115,10 @@ def test_venue_after_punctuation():
             print(f"       Expected: '{expected}'")
             print(f"       Got:      '{result}'")
 
+    batch = truncate_titles_at_venue([original for original, _ in test_cases])
+    status = "OK" if batch == [expected for _, expected in test_cases] else "FAIL"
+    print(f"  {status}: batch truncation of all {len(test_cases)} titles")
+
     print()
 
 
@@ -131,22 +161,22 @@ fn truncate_title_at_venue(title: &str) -> String {
 #
 # Location: hallucinator-pdf/src/title.rs (post-extraction validation)
 
-VENUE_ONLY_PATTERNS = [
+VENUE_ONLY_PATTERN = re.compile(
+    r'^(?:'
     # SIAM/IEEE/ACM Journal/Transactions/Review
-    re.compile(r'^(?:SIAM|IEEE|ACM|PNAS)\s+(?:Journal|Transactions|Review)', re.IGNORECASE),
+    r'(?:SIAM|IEEE|ACM|PNAS)\s+(?:Journal|Transactions|Review)'
     # Journal/Transactions/Proceedings of/on
-    re.compile(r'^(?:Journal|Transactions|Proceedings)\s+(?:of|on)\s+', re.IGNORECASE),
+    r'|(?:Journal|Transactions|Proceedings)\s+(?:of|on)\s+'
     # Advances in Neural Information Processing Systems
-    re.compile(r'^Advances\s+in\s+Neural', re.IGNORECASE),
-]
+    r'|Advances\s+in\s+Neural'
+    r')',
+    re.IGNORECASE,
+)
 
 
 def is_venue_only(text: str) -> bool:
     """Check if text is just a venue/journal name, not a paper title."""
-    for pattern in VENUE_ONLY_PATTERNS:
-        if pattern.match(text):
-            return True
-    return False
+    return VENUE_ONLY_PATTERN.match(text) is not None
 
 
 def test_venue_only():
@@ -192,14 +222,17 @@ def test_venue_only():
 RUST_VENUE_ONLY = '''
 // In title.rs:
 
-static VENUE_ONLY_PATTERNS: Lazy<Vec<Regex>> = Lazy::new(|| vec![
-    Regex::new(r"(?i)^(?:SIAM|IEEE|ACM|PNAS)\\s+(?:Journal|Transactions|Review)").unwrap(),
-    Regex::new(r"(?i)^(?:Journal|Transactions|Proceedings)\\s+(?:of|on)\\s+").unwrap(),
-    Regex::new(r"(?i)^Advances\\s+in\\s+Neural").unwrap(),
-]);
+// One alternation, so a title is checked in a single regex search
+static VENUE_ONLY_RE: Lazy<Regex> = Lazy::new(|| Regex::new(concat!(
+    r"(?i)^(?:",
+    r"(?:SIAM|IEEE|ACM|PNAS)\\s+(?:Journal|Transactions|Review)",
+    r"|(?:Journal|Transactions|Proceedings)\\s+(?:of|on)\\s+",
+    r"|Advances\\s+in\\s+Neural",
+    r")",
+)).unwrap());
 
 fn is_venue_only(text: &str) -> bool {
-    VENUE_ONLY_PATTERNS.iter().any(|re| re.is_match(text))
+    VENUE_ONLY_RE.is_match(text)
 }
 '''
 
@@ -288,20 +321,20 @@ Regex::new(r"^[A-Z]{1,3},\\s+[A-Z][a-z]+\\s+[A-Z][a-z]+,").unwrap(),
 # Location: hallucinator-pdf/src/references.rs (reference section detection)
 #           hallucinator-pdf/src/title.rs (post-extraction validation)
 
-NON_REFERENCE_PATTERNS = [
+NON_REFERENCE_PATTERN = re.compile(
+    r'^(?:'
     # NeurIPS checklist bullet points
-    re.compile(r'^[•\-]\s+(?:The answer|Released models|If you are using)', re.IGNORECASE),
+    r'[•\-]\s+(?:The answer|Released models|If you are using)'
     # Acknowledgments
-    re.compile(r'^We gratefully acknowledge', re.IGNORECASE),
-]
+    r'|We gratefully acknowledge'
+    r')',
+    re.IGNORECASE,
+)
 
 
 def is_non_reference_content(text: str) -> bool:
     """Check if text is non-reference content (checklists, acknowledgments)."""
-    for pattern in NON_REFERENCE_PATTERNS:
-        if pattern.match(text):
-            return True
-    return False
+    return NON_REFERENCE_PATTERN.match(text) is not None
 
 
 def test_non_reference_content():
@@ -343,15 +376,18 @@ def test_non_reference_content():
 RUST_NON_REFERENCE = '''
 // In title.rs:
 
-static NON_REFERENCE_PATTERNS: Lazy<Vec<Regex>> = Lazy::new(|| vec![
+// One alternation, so a title is checked in a single regex search
+static NON_REFERENCE_RE: Lazy<Regex> = Lazy::new(|| Regex::new(concat!(
+    r"(?i)^(?:",
     // NeurIPS checklist bullet points
-    Regex::new(r"(?i)^[•\\-]\\s+(?:The answer|Released models|If you are using)").unwrap(),
+    r"[•\\-]\\s+(?:The answer|Released models|If you are using)",
     // Acknowledgments
-    Regex::new(r"(?i)^We gratefully acknowledge").unwrap(),
-]);
+    r"|We gratefully acknowledge",
+    r")",
+)).unwrap());
 
 fn is_non_reference_content(text: &str) -> bool {
-    NON_REFERENCE_PATTERNS.iter().any(|re| re.is_match(text))
+    NON_REFERENCE_RE.is_match(text)
 }
 '''
 
@@ -369,7 +405,7 @@ fn is_non_reference_content(text: &str) -> bool {
 #
 # Location: hallucinator-pdf/src/title.rs (post-extraction validation)
 
-MAX_TITLE_LENGTH = 300
+MAX_TITLE_LENGTH: Final[int] = 300
 
 
 def is_title_too_long(title: str) -> bool:
@@ -605,6 +641,27 @@ fn segment_neurips_style(text: &str) -> Option<Vec<String>> {
 # COMBINED VALIDATION
 # =============================================================================
 
+def _rejection_branch(reason: str, pattern: re.Pattern) -> str:
+    """Wrap a start-anchored rejection pattern as a named alternation branch."""
+    flags = 'i' if pattern.flags & re.IGNORECASE else ''
+    return f'(?P<{reason}>(?{flags}:{pattern.pattern}))'
+
+
+# All start-anchored rejection checks fused into one pattern, so a title is
+# classified by a single match. Branches are tried in order at the start of
+# the title, so the first listed reason wins, as with sequential checks; the
+# matching branch's name is the rejection reason. Every branch is anchored,
+# so an ordinary title fails after its first few characters whatever its
+# length.
+TITLE_REJECTION_PATTERN = re.compile('|'.join([
+    _rejection_branch('venue_only', VENUE_ONLY_PATTERN),
+    _rejection_branch('author_initials_list', AUTHOR_INITIALS_LIST_PATTERN),
+    _rejection_branch('neurips_author_list', NEURIPS_AUTHOR_LIST_PATTERN),
+    _rejection_branch('non_reference_content', NON_REFERENCE_PATTERN),
+]))
+
+
+@lru_cache(maxsize=8192)
 def validate_extracted_title(title: str) -> Tuple[str, bool, Optional[str]]:
     """Validate and clean an extracted title.
 
@@ -614,24 +671,15 @@ def validate_extracted_title(title: str) -> Tuple[str, bool, Optional[str]]:
     # Truncate venue after ?/!
     title = truncate_title_at_venue(title)
 
-    # Check for venue-only
-    if is_venue_only(title):
-        return title, False, "venue_only"
-
-    # Check for author initials list (FIX 3: OpenAI style)
-    if is_author_initials_list(title):
-        return title, False, "author_initials_list"
-
-    # Check for NeurIPS/ML author list (FIX 6: I. Surname style)
-    if is_neurips_author_list(title):
-        return title, False, "neurips_author_list"
-
-    # Check for non-reference content
-    if is_non_reference_content(title):
-        return title, False, "non_reference_content"
+    # Check for venue-only, author initials list (FIX 3: OpenAI style),
+    # NeurIPS/ML author list (FIX 6: I. Surname style) and non-reference
+    # content in one pass
+    rejection = TITLE_REJECTION_PATTERN.match(title)
+    if rejection:
+        return title, False, rejection.lastgroup
 
-    # Check length
-    if is_title_too_long(title):
+    # Check length (is_title_too_long, inlined)
+    if len(title) > MAX_TITLE_LENGTH:
         return title, False, "too_long"
 
     return title, True, None
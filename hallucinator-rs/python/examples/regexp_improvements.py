@@ -32,13 +32,27 @@ Run with:
     python examples/regexp_improvements.py
 """
 
+import html
 import re
 import unicodedata
-from typing import Optional
+from bisect import bisect_right
+from functools import lru_cache
+from itertools import accumulate
+from typing import List, Optional
 
 from hallucinator import PdfExtractor
 
 
+@lru_cache(maxsize=1)
+def default_extractor() -> PdfExtractor:
+    """Shared PdfExtractor with the default configuration.
+
+    Only parse_reference is called on it, so one instance can serve every
+    reference instead of constructing a new one per call.
+    """
+    return PdfExtractor()
+
+
 # =============================================================================
 # IMPROVEMENT 1: H-infinity Unicode Symbol Normalization
 # =============================================================================
@@ -49,20 +63,34 @@ from hallucinator import PdfExtractor
 # Rust location: hallucinator-core/src/matching.rs (normalize_for_comparison)
 
 
+class _AlnumOnlyTable(dict):
+    """str.translate table that deletes all but Unicode letters and numbers.
+
+    Entries are filled in the first time a character is seen, so later
+    translations stay in C.
+    """
+
+    def __missing__(self, codepoint: int) -> Optional[int]:
+        value = self[codepoint] = codepoint if chr(codepoint).isalnum() else None
+        return value
+
+
+ALNUM_ONLY_TABLE = _AlnumOnlyTable()
+
+
+@lru_cache(maxsize=8192)
 def normalize_title_improved(title: str) -> str:
     """Normalize title for comparison with H-infinity handling.
 
     This is the improved version that should be ported to Rust.
     """
-    import html
     title = html.unescape(str(title))
     title = unicodedata.normalize("NFKD", title)
     # Handle mathematical symbols that would otherwise be stripped
     # H∞ (H-infinity) is common in control theory papers
     title = title.replace('∞', 'infinity')
-    title = title.replace('∞', 'infinity')  # Alternative infinity symbol
     # Keep only Unicode letters and numbers
-    title = ''.join(c for c in title if c.isalnum())
+    title = title.translate(ALNUM_ONLY_TABLE)
     return title.lower()
 
 
@@ -98,68 +126,82 @@ def test_h_infinity_normalization():
 # Rust location: hallucinator-pdf/src/title.rs
 
 
+# Reference number prefixes: "[12] " and "12. "
+REF_NUMBER_BRACKET_PATTERN = re.compile(r'^\[\d+\]\s*')
+REF_NUMBER_DOT_PATTERN = re.compile(r'^\d+\.\s*')
+
+# ALL CAPS author at start: "CAO X," or "LIU Z,"
+ALL_CAPS_AUTHOR_START_PATTERN = re.compile(r'^([A-Z]{2,})\s+[A-Z](?:,|\s|$)')
+
+# End of author list at "et al."
+ET_AL_PATTERN = re.compile(r',?\s+et\s+al\.?\s*[,.]?\s*', re.IGNORECASE)
+
+# A single ALL CAPS author: "SURNAME X" or just "SURNAME"
+ALL_CAPS_AUTHOR_PATTERN = re.compile(r'^[A-Z]{2,}(?:\s+[A-Z])?$')
+
+# Where the title ends - at journal/year markers. One alternation, so a
+# single scan finds the earliest marker of any kind.
+# Key addition: Chinese citation markers [J], [C], [M], [D]
+CHINESE_TITLE_END_PATTERN = re.compile(
+    r'\[[JCMD]\]'  # Chinese citation markers: journal, conference, book, dissertation
+    r'|\.\s*[A-Z][a-zA-Z\s]+\d+\s*\(\d+\)'  # ". Journal Name 34(5)"
+    r'|\.\s*[A-Z][a-zA-Z\s&+]+\d+:\d+'  # ". Journal 34:123"
+    r'|\.\s*[A-Z][a-zA-Z\s&+]+,\s*\d+'  # ". Journal Name, vol"
+    r'|\.\s*(?:19|20)\d{2}'  # ". 2024"
+    r'|\.\s*https?://'
+    r'|\.\s*doi:'
+)
+
+TRAILING_PERIOD_PATTERN = re.compile(r'\.\s*$')
+
+
 def extract_title_chinese_allcaps(ref_text: str) -> Optional[str]:
     """Extract title from Chinese ALL CAPS author format.
 
     Pattern: SURNAME I, SURNAME I, et al. Title[J]. Venue
     """
     # Strip reference number prefixes
-    ref_text = re.sub(r'^\[\d+\]\s*', '', ref_text)
-    ref_text = re.sub(r'^\d+\.\s*', '', ref_text)
+    ref_text = REF_NUMBER_BRACKET_PATTERN.sub('', ref_text)
+    ref_text = REF_NUMBER_DOT_PATTERN.sub('', ref_text)
     ref_text = ref_text.lstrip('. ')
 
-    # Check for ALL CAPS pattern at start: "CAO X," or "LIU Z,"
-    all_caps_match = re.search(r'^([A-Z]{2,})\s+[A-Z](?:,|\s|$)', ref_text)
+    # Check for ALL CAPS pattern at start: "CAO X," or "LIU Z,". Most
+    # references don't even start with a capital, so check that first.
+    if not 'A' <= ref_text[:1] <= 'Z':
+        return None
+    all_caps_match = ALL_CAPS_AUTHOR_START_PATTERN.search(ref_text)
     if not all_caps_match:
         return None
 
     # Find end of author list at "et al." or sentence boundary
-    et_al_match = re.search(r',?\s+et\s+al\.?\s*[,.]?\s*', ref_text, re.IGNORECASE)
+    et_al_match = ET_AL_PATTERN.search(ref_text)
     if et_al_match:
         after_authors = ref_text[et_al_match.end():].strip()
     else:
-        # Find where ALL CAPS author pattern ends
-        parts = ref_text.split(', ')
-        title_start_idx = None
-        for i, part in enumerate(parts):
-            part = part.strip()
+        # Find where ALL CAPS author pattern ends, walking the ", "-separated
+        # parts in place
+        start = 0
+        while True:
+            end = ref_text.find(', ', start)
+            part = ref_text[start:end] if end >= 0 else ref_text[start:]
             # Check if this looks like an ALL CAPS author (SURNAME X or just SURNAME)
-            if re.match(r'^[A-Z]{2,}(?:\s+[A-Z])?$', part):
-                continue  # Still in author list
-            # Found non-author part - this is the title start
-            title_start_idx = i
-            break
-
-        if title_start_idx is not None:
-            after_authors = ', '.join(parts[title_start_idx:]).strip()
-        else:
-            return None
+            if not ALL_CAPS_AUTHOR_PATTERN.match(part.strip()):
+                # Found non-author part - this is the title start
+                after_authors = ref_text[start:].strip()
+                break
+            if end < 0:
+                return None  # Nothing but authors
+            start = end + 2
 
     if not after_authors:
         return None
 
     # Find where title ends - at journal/year markers
-    # Key addition: Chinese citation markers [J], [C], [M], [D]
-    title_end_patterns = [
-        r'\[J\]',  # Chinese citation marker for journal
-        r'\[C\]',  # Chinese citation marker for conference
-        r'\[M\]',  # Chinese citation marker for book
-        r'\[D\]',  # Chinese citation marker for dissertation
-        r'\.\s*[A-Z][a-zA-Z\s]+\d+\s*\(\d+\)',  # ". Journal Name 34(5)"
-        r'\.\s*[A-Z][a-zA-Z\s&+]+\d+:\d+',  # ". Journal 34:123"
-        r'\.\s*[A-Z][a-zA-Z\s&+]+,\s*\d+',  # ". Journal Name, vol"
-        r'\.\s*(?:19|20)\d{2}',  # ". 2024"
-        r'\.\s*https?://',
-        r'\.\s*doi:',
-    ]
-    title_end = len(after_authors)
-    for pattern in title_end_patterns:
-        m = re.search(pattern, after_authors)
-        if m:
-            title_end = min(title_end, m.start())
+    m = CHINESE_TITLE_END_PATTERN.search(after_authors)
+    title_end = m.start() if m else len(after_authors)
 
     title = after_authors[:title_end].strip()
-    title = re.sub(r'\.\s*$', '', title)
+    title = TRAILING_PERIOD_PATTERN.sub('', title)
 
     if len(title.split()) >= 3:
         return title
@@ -232,6 +274,52 @@ def test_chinese_allcaps_format():
 #
 # Location in Python: clean_title() function
 # Rust location: hallucinator-pdf/src/title.rs (clean_title or similar)
+#
+# The patterns below use no backreferences or lookaround, so they also work
+# unchanged with the Rust regex crate. Their classes exclude ? and !, so a
+# search from one ?/! never scans past the next one, and matching stays
+# linear in the title length. They are deliberately not compiled with
+# re.ASCII: PDF text often has no-break spaces after the ?/!, which only the
+# Unicode \s matches.
+
+
+# "? In" and "? In:" patterns
+Q_IN_VENUE_PATTERN = re.compile(r'\?\s*[Ii]n:?\s+(?:[A-Z]|[12]\d{3}\s)')
+
+# "? Journal Name, vol" pattern (journal with comma before volume)
+Q_JOURNAL_COMMA_PATTERN = re.compile(
+    r'[?!]\s+[A-Z][a-zA-Z\s&+\u00AE\u2013\u2014\-]+,\s*(?:vol\.?\s*)?\d+'
+)
+
+# "? Automatica 34(" or "? IEEE Trans... 53(" patterns
+# Journal + volume without comma (with parens or brackets)
+Q_JOURNAL_VOL_PATTERN = re.compile(
+    r'[?!]\s+(?:IEEE\s+Trans[a-z.]*|ACM\s+Trans[a-z.]*|Automatica|'
+    r'J\.\s*[A-Z][a-z]+|[A-Z][a-z]+\.?\s+[A-Z][a-z]+\.?)\s+\d+\s*[(\[]'
+)
+
+# "? IEEE Trans. Aut. Contr. 53" (abbreviated journal + volume, no parens)
+# This catches patterns like "IEEE Trans. Xxx. Yyy. NN" or "IEEE Trans. Xxx. NN"
+Q_ABBREV_JOURNAL_PATTERN = re.compile(
+    r'[?!]\s+(?:IEEE|ACM|SIAM)\s+Trans[a-z.]*'
+    r'(?:\s+[A-Z][a-z]+\.?)+\s+\d+'
+)
+
+# All four venue leaks as one alternation. The title is cut just after the
+# ?/! that starts a leak. No match can run past a later ?/!, so cutting at
+# the earliest leak of any kind is the same as applying the four patterns
+# one after another, and one search finds it. The only literal every branch
+# needs is that leading ?/!, which clean_title_question_mark_fix checks for
+# first; branches like "? Nature Physics, 1" have no fixed keyword to feed a
+# multi-literal (Aho-Corasick) prefilter.
+Q_VENUE_LEAK_PATTERN = re.compile('|'.join(
+    f'(?:{p.pattern})' for p in (
+        Q_IN_VENUE_PATTERN,
+        Q_JOURNAL_COMMA_PATTERN,
+        Q_JOURNAL_VOL_PATTERN,
+        Q_ABBREV_JOURNAL_PATTERN,
+    )
+))
 
 
 def clean_title_question_mark_fix(title: str) -> str:
@@ -239,41 +327,35 @@ def clean_title_question_mark_fix(title: str) -> str:
 
     This is the improved version that should be ported to Rust.
     """
-    # Handle "? In" and "? In:" patterns
-    in_venue_match = re.search(r'\?\s*[Ii]n:?\s+(?:[A-Z]|[12]\d{3}\s)', title)
-    if in_venue_match:
-        title = title[:in_venue_match.start() + 1]  # Keep the question mark
+    # Every leak starts at a ?/!, and most titles have neither
+    if '?' not in title and '!' not in title:
+        return title
 
-    # Handle "? Journal Name, vol" pattern (journal with comma before volume)
-    q_journal_comma_match = re.search(
-        r'[?!]\s+[A-Z][a-zA-Z\s&+\u00AE\u2013\u2014\-]+,\s*(?:vol\.?\s*)?\d+', title
-    )
-    if q_journal_comma_match:
-        title = title[:q_journal_comma_match.start() + 1]
-
-    # Handle "? Automatica 34(" or "? IEEE Trans... 53(" patterns
-    # Journal + volume without comma (with parens or brackets)
-    q_journal_vol_match = re.search(
-        r'[?!]\s+(?:IEEE\s+Trans[a-z.]*|ACM\s+Trans[a-z.]*|Automatica|'
-        r'J\.\s*[A-Z][a-z]+|[A-Z][a-z]+\.?\s+[A-Z][a-z]+\.?)\s+\d+\s*[(\[]',
-        title
-    )
-    if q_journal_vol_match:
-        title = title[:q_journal_vol_match.start() + 1]
-
-    # Handle "? IEEE Trans. Aut. Contr. 53" (abbreviated journal + volume, no parens)
-    # This catches patterns like "IEEE Trans. Xxx. Yyy. NN" or "IEEE Trans. Xxx. NN"
-    q_abbrev_journal_match = re.search(
-        r'[?!]\s+(?:IEEE|ACM|SIAM)\s+Trans[a-z.]*'
-        r'(?:\s+[A-Z][a-z]+\.?)+\s+\d+',
-        title
-    )
-    if q_abbrev_journal_match:
-        title = title[:q_abbrev_journal_match.start() + 1]
+    # Handle "? In", "? Journal Name, vol", "? Automatica 34(" and
+    # "? IEEE Trans. Aut. Contr. 53" patterns in one pass
+    venue_leak_match = Q_VENUE_LEAK_PATTERN.search(title)
+    if venue_leak_match:
+        title = title[:venue_leak_match.start() + 1]  # Keep the ?/!
 
     return title
 
 
+def clean_titles_question_mark_fix(titles: List[str]) -> List[str]:
+    """Batch form of clean_title_question_mark_fix; mirrors truncate_titles_at_venue
+    in neurips_fps_regexps.py (one finditer pass over the NUL-joined titles).
+    """
+    joined = '\0'.join(titles)
+    starts = list(accumulate((len(t) + 1 for t in titles[:-1]), initial=0))
+    cleaned = list(titles)
+    last = -1
+    for match in Q_VENUE_LEAK_PATTERN.finditer(joined):
+        i = bisect_right(starts, match.start()) - 1
+        if i != last:  # Only the first match in a title counts
+            cleaned[i] = joined[starts[i]:match.start() + 1]
+            last = i
+    return cleaned
+
+
 def test_venue_leak_after_question():
     """Test venue leak prevention after question marks."""
     print("=" * 60)
@@ -308,6 +390,12 @@ def test_venue_leak_after_question():
             print(f"    Got:      {cleaned}")
             print(f"    Expected: {expected_clean}")
 
+    batch = clean_titles_question_mark_fix([dirty for dirty, _ in test_cases])
+    if batch == [expected for _, expected in test_cases]:
+        print(f"  OK: batch of {len(test_cases)} titles")
+    else:
+        print("  MISMATCH: batch cleaning differs from per-title cleaning")
+
     print()
 
 
@@ -327,7 +415,7 @@ def test_two_word_quoted_titles():
     print("IMPROVEMENT 5: 2-Word Quoted Titles")
     print("=" * 60)
 
-    ext = PdfExtractor()
+    ext = default_extractor()
     # Current Rust requires 3+ words; this should be reduced to 2 for quoted
 
     test_cases = [
@@ -349,12 +437,14 @@ def test_two_word_quoted_titles():
     print("  NOTE: Rust currently requires 3+ words for quoted titles.")
     print("  These tests may fail until the improvement is ported.\n")
 
-    for ref_text, expected_title in test_cases:
+    # The title may have trailing comma stripped; strip the expected side once
+    test_cases = [(ref_text, expected, expected.rstrip(',')) for ref_text, expected in test_cases]
+
+    for ref_text, expected_title, expected_stripped in test_cases:
         ref = ext.parse_reference(ref_text)
         if ref and ref.title:
-            # The title may have trailing comma stripped
             got = ref.title.rstrip(',') + (',' if expected_title.endswith(',') else '')
-            if got == expected_title or ref.title == expected_title.rstrip(','):
+            if got == expected_title or ref.title == expected_stripped:
                 print(f"  OK: '{ref.title}'")
             else:
                 print(f"  MISMATCH: got '{ref.title}', expected '{expected_title}'")
@@ -379,10 +469,16 @@ def strip_reference_prefix(ref_text: str) -> str:
 
     This should be part of preprocessing in title extraction.
     """
-    # Strip [N] prefix
-    ref_text = re.sub(r'^\[\d+\]\s*', '', ref_text)
-    # Strip N. prefix
-    ref_text = re.sub(r'^\d+\.\s*', '', ref_text)
+    # Strip [N] prefix (REF_NUMBER_BRACKET_PATTERN, by index arithmetic)
+    if ref_text.startswith('['):
+        end = ref_text.find(']')
+        if end > 1 and ref_text[1:end].isdecimal():
+            ref_text = ref_text[end + 1:].lstrip()
+    # Strip N. prefix (REF_NUMBER_DOT_PATTERN)
+    if ref_text[:1].isdecimal():
+        end = ref_text.find('.')
+        if end > 0 and ref_text[:end].isdecimal():
+            ref_text = ref_text[end + 1:].lstrip()
     # Strip leading punctuation artifacts
     ref_text = ref_text.lstrip('. ')
     return ref_text
@@ -434,9 +530,20 @@ def should_skip_format5_for_chinese(ref_text: str) -> bool:
     The key difference is the spacing around the initial.
     """
     # Chinese pattern: SURNAME followed by space and single initial
-    # e.g., "CAO X," or "LIU Z,"
-    return bool(re.match(r'^[A-Z]{2,}', ref_text) and
-                re.search(r'^[A-Z]{2,}\s+[A-Z](?:,|\s)', ref_text))
+    # e.g., "CAO X," or "LIU Z,". Scanned by hand as ^[A-Z]{2,}\s+[A-Z](?:,|\s);
+    # the scan stops at the first character that doesn't fit.
+    n = len(ref_text)
+    i = 0
+    while i < n and 'A' <= ref_text[i] <= 'Z':
+        i += 1
+    if i < 2:
+        return False
+    j = i
+    while j < n and ref_text[j].isspace():
+        j += 1
+    if j == i or j + 1 >= n or not 'A' <= ref_text[j] <= 'Z':
+        return False
+    return ref_text[j + 1] == ',' or ref_text[j + 1].isspace()
 
 
 def test_format5_skip_detection():
@@ -1080,12 +1187,20 @@ EDITOR_LIST_PATTERNS = {
 # =============================================================================
 
 
+# Shorter reference text can't hold a title plus anything around it
+# (typically parse debris such as "[12]" or "pp. 1-4")
+MIN_REFERENCE_LENGTH = 10
+
+
 def extract_title_with_improvements(ref_text: str) -> Optional[str]:
     """Extract title using all improvements.
 
     This combines all the improvements into a single function that can be
     used to validate behavior before porting to Rust.
     """
+    if len(ref_text) < MIN_REFERENCE_LENGTH:
+        return None
+
     original_text = ref_text
 
     # Preprocessing
@@ -1122,7 +1237,7 @@ def extract_title_with_improvements(ref_text: str) -> Optional[str]:
         return clean_title_question_mark_fix(title)
 
     # Fall back to native extraction
-    ext = PdfExtractor()
+    ext = default_extractor()
     ref = ext.parse_reference(original_text)
     if ref and ref.title:
         title = clean_title_editor_list(ref.title)
@@ -1157,11 +1272,14 @@ def test_combined_extraction():
         ),
     ]
 
-    for ref_text, expected in test_cases:
+    # Trailing ,/? are ignored when comparing; strip the expected side once
+    test_cases = [(ref_text, expected, expected.rstrip(',?')) for ref_text, expected in test_cases]
+
+    for ref_text, expected, expected_stripped in test_cases:
         result = extract_title_with_improvements(ref_text)
         if result is None:
             print(f"  FAIL: No title from '{ref_text[:50]}...'")
-        elif result.rstrip(',?') == expected.rstrip(',?'):
+        elif result.rstrip(',?') == expected_stripped:
             print(f"  OK: '{result}'")
         else:
             print(f"  PARTIAL:")
@@ -1677,8 +1795,6 @@ def get_query_words_improved(title: str, n: int = 6) -> list:
     Preserves trailing punctuation (?, !) and hyphenated/apostrophe words
     to improve search accuracy for titles like "Is AI Safe?" or "What's Next?".
     """
-    import re
-
     STOP_WORDS = {'a', 'an', 'the', 'of', 'and', 'or', 'for', 'to', 'in', 'on', 'with', 'by'}
 
     # Keep punctuation attached to words
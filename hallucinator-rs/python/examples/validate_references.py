@@ -10,6 +10,8 @@ import sys
 
 from hallucinator import PdfExtractor, Validator, ValidatorConfig
 
+ICONS = {"verified": "+", "not_found": "?", "author_mismatch": "~"}
+
 
 def main():
     if len(sys.argv) < 2:
@@ -46,11 +48,7 @@ def main():
             print(f"  [{event.index + 1}/{event.total}] Checking: {event.title}")
         elif event.event_type == "result":
             r = event.result
-            status_icon = {
-                "verified": "+",
-                "not_found": "?",
-                "author_mismatch": "~",
-            }.get(r.status, " ")
+            status_icon = ICONS.get(r.status, " ")
             source = f" ({r.source})" if r.source else ""
             print(f"  [{status_icon}] {r.title}{source}")
         elif event.event_type == "retry_pass":
@@ -11,6 +11,7 @@ from hallucinator._native import (
     Reference,
     ExtractionResult,
     SkipStats,
+    clean_title,
     # Archive extraction
     ArchiveEntry,
     ArchiveIterator,
@@ -33,6 +34,7 @@ __all__ = [
     "Reference",
     "ExtractionResult",
     "SkipStats",
+    "clean_title",
     # Archive extraction
     "ArchiveEntry",
     "ArchiveIterator",
@@ -13,6 +13,7 @@ from hallucinator._native import SkipStats as SkipStats
 from hallucinator._native import ValidationResult as ValidationResult
 from hallucinator._native import Validator as Validator
 from hallucinator._native import ValidatorConfig as ValidatorConfig
+from hallucinator._native import clean_title as clean_title
 from hallucinator._native import ArchiveEntry as ArchiveEntry
 from hallucinator._native import ArchiveIterator as ArchiveIterator
 from hallucinator._native import is_archive_path as is_archive_path
@@ -87,6 +87,10 @@ class NativePdfExtractor:
     ) -> tuple[Optional[Reference], Optional[str]]: ...
     def extract_from_text(self, text: str) -> ExtractionResult: ...
 
+def clean_title(title: str, from_quotes: bool = False) -> str:
+    """Clean an extracted title by removing trailing venue/metadata."""
+    ...
+
 # ── Validation pipeline ──
 
 class ValidatorConfig:
@@ -98,7 +102,10 @@ class ValidatorConfig:
     s2_api_key: Optional[str]
     dblp_offline_path: Optional[str]
     acl_offline_path: Optional[str]
-    max_concurrent_refs: int
+    cache_path: Optional[str]
+    cache_positive_ttl_secs: int
+    cache_negative_ttl_secs: int
+    num_workers: int
     db_timeout_secs: int
     db_timeout_short_secs: int
     disabled_dbs: list[str]
@@ -2,7 +2,7 @@
 
 import pytest
 
-from hallucinator import PdfExtractor, Reference, ExtractionResult
+from hallucinator import PdfExtractor, Reference, ExtractionResult, clean_title
 from hallucinator._native import NativePdfExtractor
 
 
@@ -95,6 +95,13 @@ def test_parse_reference_ieee():
     assert len(ref.authors) >= 1
 
 
+def test_clean_title_cuts_venue_after_question_mark():
+    assert (
+        clean_title("Are toll lanes elitist? In Proceedings of AAAI 2024")
+        == "Are toll lanes elitist?"
+    )
+
+
 def test_parse_reference_url_only():
     """URL-only refs are no longer skipped — they're returned with extracted URLs."""
     ext = PdfExtractor()
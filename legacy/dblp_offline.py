@@ -6,93 +6,402 @@ for fast local lookups without API rate limiting.
 """
 
 import gzip
+import heapq
+import io
+import multiprocessing
 import os
 import re
+import shutil
 import sqlite3
+import tempfile
+import threading
 import time
+import unicodedata
 import urllib.request
+from collections import deque
 from datetime import datetime, timezone
+from contextlib import contextmanager
+from functools import lru_cache
+from operator import itemgetter
+
+try:
+    # Optional: parallel gzip decompression for building the offline database
+    import rapidgzip
+except ImportError:
+    rapidgzip = None
 
 # DBLP RDF predicates we care about
 DBLP_TITLE = "https://dblp.org/rdf/schema#title"
 DBLP_AUTHORED_BY = "https://dblp.org/rdf/schema#authoredBy"
 DBLP_PRIMARY_NAME = "https://dblp.org/rdf/schema#primaryCreatorName"
 
+# Byte forms of the predicates, for matching the raw dump without decoding
+DBLP_TITLE_B = DBLP_TITLE.encode()
+DBLP_AUTHORED_BY_B = DBLP_AUTHORED_BY.encode()
+DBLP_PRIMARY_NAME_B = DBLP_PRIMARY_NAME.encode()
+
+# Tags for the predicates the build collects; all other triples are skipped
+TAG_TITLE, TAG_AUTHORED_BY, TAG_PRIMARY_NAME = 0, 1, 2
+PREDICATE_TAGS = {
+    DBLP_TITLE_B: TAG_TITLE,
+    DBLP_AUTHORED_BY_B: TAG_AUTHORED_BY,
+    DBLP_PRIMARY_NAME_B: TAG_PRIMARY_NAME,
+}
+
+# Cheap substring tests for lines that may carry the predicates each build
+# pass collects, checked before running the full line regex
+AUTHOR_NAME_PREDICATE_RE = re.compile(rb'#primaryCreatorName>')
+PUBLICATION_PREDICATE_RE = re.compile(rb'#(?:title|authoredBy)>')
+
+# Separator between author names in publications.authors: the ASCII unit
+# separator, which never occurs in names. The build records it in the
+# metadata table; databases without that entry use "; ".
+AUTHOR_SEPARATOR = "\x1f"
+
 # Daily dump URL
 DBLP_DUMP_URL = "https://dblp.org/rdf/dblp.nt.gz"
 
 # Staleness threshold in days
 STALENESS_THRESHOLD_DAYS = 30
 
+# Buffer size for reading the decompressed dump
+READ_BUFFER_SIZE = 1024 * 1024
+
+# Chunk size for streaming the dump download to disk
+DOWNLOAD_BUFFER_SIZE = 8 * 1024 * 1024
+
+# Bytes downloaded between progress messages
+DOWNLOAD_REPORT_INTERVAL = 50 * 1024 * 1024
+
+# Decompressed bytes scanned by each worker process when building in parallel
+SHARD_SIZE = 128 * 1024 * 1024
+
+# Default cap on build worker processes. Past a few workers the single SQLite
+# writer is the bottleneck, and each worker holds a shard's results in memory.
+MAX_BUILD_WORKERS = 4
+
+# Bytes of the database memory-mapped by query connections (SQLite clamps
+# this to its compile-time maximum)
+QUERY_MMAP_SIZE = 32 * 1024 * 1024 * 1024
+
+
+# One N-Triples statement: <subject> <predicate> (<uri> | "literal"[^^<type>|@lang]) .
+# Group 3 is set for URI objects, group 4 for literal objects.
+NTRIPLES_LINE_RE = re.compile(
+    r'\s*<([^>]+)>\s+<([^>]+)>\s+'
+    r'(?:<([^>]+)>|"((?:[^"\\]|\\.)*)"(?:\^\^<[^>]+>|@[a-zA-Z]+(?:-[a-zA-Z0-9]+)*)?)'
+    r'\s*\.\s*$'
+)
+NTRIPLES_LINE_RE_B = re.compile(NTRIPLES_LINE_RE.pattern.encode())
+
+# Escape sequences we unescape in literals, applied in a single pass
+_LITERAL_ESCAPE_RE = re.compile(r'\\([nt"\\])')
+_LITERAL_ESCAPE_RE_B = re.compile(_LITERAL_ESCAPE_RE.pattern.encode())
+_LITERAL_ESCAPES = {'n': '\n', 't': '\t', '"': '"', '\\': '\\'}
+_LITERAL_ESCAPES.update({k.encode(): v.encode() for k, v in _LITERAL_ESCAPES.items()})
+
+
+def _unescape_literal(match):
+    return _LITERAL_ESCAPES[match.group(1)]
+
 
 def parse_ntriples_line(line):
     """Parse a single N-Triples line into (subject, predicate, object).
 
     N-Triples format: <subject> <predicate> <object> .
     Objects can be URIs (<...>) or literals ("..." or "..."^^type or "..."@lang)
+
+    Accepts str or bytes; the returned parts have the same type as the line.
     """
-    line = line.strip()
-    if not line or line.startswith('#'):
+    if isinstance(line, bytes):
+        return _parse_ntriples_bytes(line)
+
+    match = NTRIPLES_LINE_RE.match(line)
+    if not match:
         return None, None, None
 
-    # Match URI pattern: <...>
-    uri_pattern = r'<([^>]+)>'
-    # Match literal pattern: "..." with optional ^^type or @lang
-    literal_pattern = r'"((?:[^"\\]|\\.)*)(?:"(?:\^\^<[^>]+>|@[a-z]+)?)?'
+    subj, pred, uri, literal = match.groups()
+    if uri is not None:
+        return subj, pred, uri
+    if '\\' in literal:
+        literal = _LITERAL_ESCAPE_RE.sub(_unescape_literal, literal)
+    return subj, pred, literal
+
 
-    parts = []
-    pos = 0
+def _parse_ntriples_bytes(line):
+    """Bytes variant of parse_ntriples_line, used when scanning the raw dump."""
+    match = NTRIPLES_LINE_RE_B.match(line)
+    if not match:
+        return None, None, None
 
-    for i in range(3):
-        # Skip whitespace
-        while pos < len(line) and line[pos] in ' \t':
-            pos += 1
+    subj, pred, uri, literal = match.groups()
+    if uri is not None:
+        return subj, pred, uri
+    if b'\\' in literal:
+        literal = _LITERAL_ESCAPE_RE_B.sub(_unescape_literal, literal)
+    return subj, pred, literal
 
-        if pos >= len(line):
-            return None, None, None
 
-        if line[pos] == '<':
-            # URI
-            match = re.match(uri_pattern, line[pos:])
-            if match:
-                parts.append(match.group(1))
-                pos += match.end()
-            else:
-                return None, None, None
-        elif line[pos] == '"':
-            # Literal
-            match = re.match(literal_pattern, line[pos:])
-            if match:
-                # Unescape common escape sequences
-                value = match.group(1)
-                value = value.replace('\\n', '\n').replace('\\t', '\t')
-                value = value.replace('\\"', '"').replace('\\\\', '\\')
-                parts.append(value)
-                # Find end of literal (including type/lang suffix)
-                end_quote = line.find('"', pos + 1)
-                while end_quote > 0 and line[end_quote - 1] == '\\':
-                    end_quote = line.find('"', end_quote + 1)
-                if end_quote > 0:
-                    # Skip past optional ^^<type> or @lang
-                    pos = end_quote + 1
-                    if pos < len(line) and line[pos:pos+2] == '^^':
-                        type_match = re.match(r'\^\^<[^>]+>', line[pos:])
-                        if type_match:
-                            pos += type_match.end()
-                    elif pos < len(line) and line[pos] == '@':
-                        lang_match = re.match(r'@[a-z]+', line[pos:])
-                        if lang_match:
-                            pos += lang_match.end()
-                else:
-                    return None, None, None
-            else:
-                return None, None, None
+def open_ntriples(path):
+    """Open an N-Triples dump (optionally gzipped) for binary line iteration.
+
+    Gzipped dumps are inflated on all cores with rapidgzip when it is
+    installed, falling back to the single-threaded gzip module otherwise.
+    """
+    if not path.endswith('.gz'):
+        return open(path, 'rb', buffering=READ_BUFFER_SIZE)
+    if rapidgzip is not None:
+        raw = rapidgzip.open(path, parallelization=os.cpu_count() or 1)
+    else:
+        raw = gzip.open(path, 'rb')
+    return io.BufferedReader(raw, buffer_size=READ_BUFFER_SIZE)
+
+
+def scan_author_names(f, on_progress=None):
+    """Collect author names (primaryCreatorName triples) from a dump stream.
+
+    This is the first build pass. Names are the only state the build keeps
+    for the whole dump, so it runs in O(unique authors) memory. All URIs and
+    names are raw bytes. This loop sees every line of the dump (billions),
+    so lookups are bound to locals up front.
+
+    Args:
+        f: Binary file object yielding N-Triples lines
+        on_progress: Optional callback(triples_processed, publications_found);
+            publications_found is always 0 in this pass
+
+    Returns:
+        (triple_count, author_names) where author_names maps author_uri -> name
+    """
+    author_names = {}
+
+    parse = _parse_ntriples_bytes
+    is_name = AUTHOR_NAME_PREDICATE_RE.search
+    start_time = time.time()
+    triple_count = 0
+
+    for line in f:
+        # The dump holds one triple per line; count them all, but only parse
+        # the small fraction that can carry an author name
+        triple_count += 1
+        if triple_count % 5_000_000 == 0:
+            elapsed = time.time() - start_time
+            print(f"  Processed {triple_count / 1_000_000:.1f}M triples ({elapsed:.0f}s)")
+            if on_progress:
+                on_progress(triple_count, 0)
+
+        if not is_name(line):
+            continue
+
+        subj, pred, obj = parse(line)
+        if subj and pred == DBLP_PRIMARY_NAME_B:
+            author_names[subj] = obj
+
+    return triple_count, author_names
+
+
+def iter_publications(f, author_names):
+    """Yield (pub_uri, title, authors) for each publication in a dump stream.
+
+    This is the second build pass. DBLP dumps list all triples about a
+    subject together, so a publication is complete, and can be written out,
+    as soon as its run of triples ends. Nothing else is held in memory.
+
+    A publication whose triples are split into several runs is yielded once
+    per run; the caller merges them. title is None for a run without a title
+    triple. authors is the run's author names, in order, joined with
+    AUTHOR_SEPARATOR; authors without a known name are skipped. Everything
+    is raw bytes.
+    """
+    parse = _parse_ntriples_bytes
+    is_interesting = PUBLICATION_PREDICATE_RE.search
+    predicate_tag = PREDICATE_TAGS.get
+    author_name = author_names.get
+    separator = AUTHOR_SEPARATOR.encode()
+
+    current = None
+    title = None
+    names = []
+
+    for line in f:
+        if not is_interesting(line):
+            continue
+
+        subj, pred, obj = parse(line)
+        if not subj:
+            continue
+
+        # One hash lookup classifies the predicate instead of comparisons
+        # against long URIs that share a 28-byte prefix
+        tag = predicate_tag(pred)
+        if tag != TAG_TITLE and tag != TAG_AUTHORED_BY:
+            continue
+
+        if subj != current:
+            if current is not None:
+                yield current, title, separator.join(names)
+            current, title, names = subj, None, []
+
+        if tag == TAG_TITLE:
+            title = obj
         else:
-            return None, None, None
+            name = author_name(obj)
+            if name:
+                names.append(name)
+
+    if current is not None:
+        yield current, title, separator.join(names)
+
+
+def _shard_lines(shard):
+    """Yield the lines starting in one shard of a dump.
+
+    A line belongs to the shard containing its first byte, so a shard skips
+    the partial line it starts in and finishes the one it ends in. Lines are
+    read in READ_BUFFER_SIZE batches, so a worker never holds the whole
+    shard in memory.
+    """
+    path, index_path, start, end = shard
+    if index_path:
+        f = rapidgzip.open(path, parallelization=1)
+        f.import_index(index_path)
+    else:
+        f = open(path, 'rb', buffering=READ_BUFFER_SIZE)
+    with f:
+        if start:
+            f.seek(start - 1)
+            f.readline()
+        pos = f.tell()
+        while pos < end:
+            lines = f.readlines(READ_BUFFER_SIZE)
+            if not lines:
+                break
+            # A batch may run past end; those lines belong to the next shard
+            for line in lines:
+                if pos >= end:
+                    return
+                yield line
+                pos += len(line)
+
+
+def _scan_author_names_shard(shard):
+    """Pool worker: run scan_author_names over one shard."""
+    return scan_author_names(_shard_lines(shard))
+
+
+# Author names for _iter_publications_shard, set once per worker process
+_worker_author_names = None
+
+
+def _init_publications_worker(author_names):
+    global _worker_author_names
+    _worker_author_names = author_names
+
+
+def _iter_publications_shard(shard):
+    """Pool worker: collect iter_publications over one shard."""
+    return list(iter_publications(_shard_lines(shard), _worker_author_names))
+
+
+def plan_shards(path, tmp_dir):
+    """Split a dump into SHARD_SIZE slices for parallel scanning.
+
+    Shards are cut at decompressed byte offsets, so gzipped dumps need
+    rapidgzip: its seek index is built once here (inflating on all cores)
+    into tmp_dir and shared by the workers of both build passes.
+
+    Returns:
+        List of (path, index_path, start, end) shards
+    """
+    index_path = None
+    if path.endswith('.gz'):
+        index_path = os.path.join(tmp_dir, 'dump.gzindex')
+        with rapidgzip.open(path, parallelization=os.cpu_count() or 1) as f:
+            size = f.seek(0, io.SEEK_END)
+            f.export_index(index_path)
+    else:
+        size = os.path.getsize(path)
+
+    return [
+        (path, index_path, start, min(start + SHARD_SIZE, size))
+        for start in range(0, size, SHARD_SIZE)
+    ]
 
-    if len(parts) == 3:
-        return parts[0], parts[1], parts[2]
-    return None, None, None
+
+def _imap_bounded(pool, func, items, ahead):
+    """Like pool.imap, but with at most `ahead` results pending at a time.
+
+    pool.imap keeps dispatching work however far the consumer falls behind,
+    so finished shard results could pile up in memory.
+    """
+    pending = deque()
+    for item in items:
+        pending.append(pool.apply_async(func, (item,)))
+        if len(pending) >= ahead:
+            yield pending.popleft().get()
+    while pending:
+        yield pending.popleft().get()
+
+
+def scan_author_names_parallel(shards, workers, on_progress=None):
+    """Run scan_author_names over shards with a pool of worker processes.
+
+    Returns:
+        Same tuple as scan_author_names
+    """
+    triple_count = 0
+    author_names = {}
+
+    with multiprocessing.Pool(workers) as pool:
+        shard_results = _imap_bounded(pool, _scan_author_names_shard, shards, 2 * workers)
+        for shard_count, shard_names in shard_results:
+            triple_count += shard_count
+            author_names.update(shard_names)
+
+            print(f"  Processed {triple_count / 1_000_000:.1f}M triples")
+            if on_progress:
+                on_progress(triple_count, 0)
+
+    return triple_count, author_names
+
+
+def iter_publications_parallel(shards, workers, author_names):
+    """Run iter_publications over shards with a pool of worker processes.
+
+    Shards are yielded in dump order, so a publication straddling a shard
+    boundary comes out as two consecutive runs, like any other split run.
+    """
+    with multiprocessing.Pool(workers, _init_publications_worker, (author_names,)) as pool:
+        for publications in _imap_bounded(pool, _iter_publications_shard, shards, 2 * workers):
+            yield from publications
+
+
+class _ProgressWriter:
+    """File wrapper that reports download progress as chunks are written."""
+
+    def __init__(self, f, total_size, on_progress=None):
+        self.f = f
+        self.total_size = total_size
+        self.on_progress = on_progress
+        self.downloaded = 0
+        self.last_report = 0
+
+    def write(self, chunk):
+        n = self.f.write(chunk)
+        self.downloaded += n
+        downloaded, total_size = self.downloaded, self.total_size
+
+        if downloaded - self.last_report >= DOWNLOAD_REPORT_INTERVAL:
+            if total_size:
+                pct = 100 * downloaded / total_size
+                print(f"  Downloaded {downloaded / (1024*1024):.0f}MB / {total_size / (1024*1024):.0f}MB ({pct:.1f}%)")
+            else:
+                print(f"  Downloaded {downloaded / (1024*1024):.0f}MB")
+            self.last_report = downloaded
+
+        if self.on_progress:
+            self.on_progress(downloaded, total_size)
+        return n
 
 
 def download_dblp_dump(output_path, on_progress=None):
@@ -114,119 +423,155 @@ def download_dblp_dump(output_path, on_progress=None):
         total_size = int(response.headers.get('Content-Length', 0))
 
     # Download with progress
-    downloaded = 0
-    last_report = 0
-    chunk_size = 1024 * 1024  # 1MB chunks
-
     req = urllib.request.Request(DBLP_DUMP_URL)
     with urllib.request.urlopen(req) as response:
         with open(output_path, 'wb') as f:
-            while True:
-                chunk = response.read(chunk_size)
-                if not chunk:
-                    break
-                f.write(chunk)
-                downloaded += len(chunk)
-
-                # Report progress every 50MB
-                if downloaded - last_report >= 50 * 1024 * 1024:
-                    if total_size:
-                        pct = 100 * downloaded / total_size
-                        print(f"  Downloaded {downloaded / (1024*1024):.0f}MB / {total_size / (1024*1024):.0f}MB ({pct:.1f}%)")
-                    else:
-                        print(f"  Downloaded {downloaded / (1024*1024):.0f}MB")
-                    last_report = downloaded
-
-                if on_progress:
-                    on_progress(downloaded, total_size)
+            shutil.copyfileobj(
+                response,
+                _ProgressWriter(f, total_size, on_progress),
+                DOWNLOAD_BUFFER_SIZE,
+            )
 
     print(f"Download complete: {output_path}")
     return output_path
 
 
-def build_sqlite_db(ntriples_path, db_path, on_progress=None):
+def build_sqlite_db(ntriples_path, db_path, on_progress=None, workers=None):
     """Build SQLite database from N-Triples dump.
 
     Args:
         ntriples_path: Path to .nt.gz file
         db_path: Output SQLite database path
-        on_progress: Optional callback(triples_processed, publications_found)
+        on_progress: Optional callback(triples_processed, publications_found).
+            publications_found is 0 while author names are collected in the
+            first pass.
+        workers: Processes for scanning the dump (default: all cores, at
+            most MAX_BUILD_WORKERS).
+            Gzipped dumps are only scanned in parallel when rapidgzip is
+            installed.
 
     This is a two-pass process:
-    1. First pass: collect all publications with titles and their author links
-    2. Second pass: resolve author names
-    Then write to SQLite with FTS index.
+    1. First pass: collect author names
+    2. Second pass: stream publications with their titles and resolved
+       authors straight into SQLite
+    Then build the FTS index.
     """
     print(f"Building SQLite database from {ntriples_path}...")
     print("This may take 10-20 minutes for the full dump.")
 
-    # Data structures for first pass
-    pub_titles = {}      # pub_uri -> title
-    pub_authors = {}     # pub_uri -> [author_uri, ...]
-    author_names = {}    # author_uri -> name
-
-    # First pass: collect everything
     start_time = time.time()
-    triple_count = 0
-
-    opener = gzip.open if ntriples_path.endswith('.gz') else open
-
-    print("Pass 1: Extracting triples...")
-    with opener(ntriples_path, 'rt', encoding='utf-8', errors='replace') as f:
-        for line in f:
-            subj, pred, obj = parse_ntriples_line(line)
-            if not subj:
-                continue
 
-            triple_count += 1
-
-            if pred == DBLP_TITLE:
-                pub_titles[subj] = obj
-            elif pred == DBLP_AUTHORED_BY:
-                if subj not in pub_authors:
-                    pub_authors[subj] = []
-                pub_authors[subj].append(obj)
-            elif pred == DBLP_PRIMARY_NAME:
-                author_names[subj] = obj
-
-            if triple_count % 5_000_000 == 0:
-                elapsed = time.time() - start_time
-                print(f"  Processed {triple_count / 1_000_000:.1f}M triples ({elapsed:.0f}s)")
-                if on_progress:
-                    on_progress(triple_count, len(pub_titles))
+    if workers is None:
+        workers = min(os.cpu_count() or 1, MAX_BUILD_WORKERS)
+    if ntriples_path.endswith('.gz') and rapidgzip is None:
+        workers = 1
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        shards = None
+        if workers > 1:
+            shards = plan_shards(ntriples_path, tmp_dir)
+            print(f"  Scanning {len(shards)} shards with {workers} workers")
+
+        # Everything stays as raw UTF-8 bytes until it is written to SQLite,
+        # so the ~2B parsed lines are never decoded.
+        print("Pass 1: Collecting author names...")
+        if shards:
+            triple_count, author_names = scan_author_names_parallel(shards, workers, on_progress)
+        else:
+            with open_ntriples(ntriples_path) as f:
+                triple_count, author_names = scan_author_names(f, on_progress)
 
-    print(f"  Total: {triple_count:,} triples")
-    print(f"  Found {len(pub_titles):,} publications with titles")
-    print(f"  Found {len(author_names):,} author names")
+        print(f"  Total: {triple_count:,} triples")
+        print(f"  Found {len(author_names):,} author names")
 
-    # Build database
-    print("Pass 2: Building SQLite database...")
+        # Build database
+        print("Pass 2: Building SQLite database...")
 
-    # Remove existing db
-    if os.path.exists(db_path):
-        os.remove(db_path)
+        # Remove existing db. A cached query connection would otherwise keep
+        # reading the replaced file.
+        close_query_connection(db_path)
+        if os.path.exists(db_path):
+            os.remove(db_path)
 
-    conn = sqlite3.connect(db_path)
-    cur = conn.cursor()
+        # Bulk-load settings: no rollback journal or fsync, since a crashed
+        # build just needs to be re-run from scratch. Autocommit is disabled
+        # by managing the single transaction explicitly.
+        conn = sqlite3.connect(db_path, isolation_level=None)
+        cur = conn.cursor()
+        cur.execute('PRAGMA journal_mode = OFF')
+        cur.execute('PRAGMA synchronous = OFF')
+        cur.execute('PRAGMA locking_mode = EXCLUSIVE')
+        cur.execute('PRAGMA cache_size = -1048576')  # 1 GB page cache
+        cur.execute('PRAGMA temp_store = MEMORY')
+        cur.execute('BEGIN')
+
+        # Create tables. The publication URI doubles as its URL (DBLP URIs are
+        # web-accessible), so url is computed on read rather than stored.
+        cur.execute('''
+            CREATE TABLE publications (
+                id INTEGER PRIMARY KEY,
+                uri TEXT UNIQUE,
+                title TEXT,
+                authors TEXT,
+                url TEXT GENERATED ALWAYS AS (uri) VIRTUAL
+            )
+        ''')
 
-    # Create tables
-    cur.execute('''
-        CREATE TABLE publications (
-            id INTEGER PRIMARY KEY,
-            uri TEXT UNIQUE,
-            title TEXT,
-            authors TEXT,
-            url TEXT
-        )
-    ''')
+        cur.execute('''
+            CREATE VIRTUAL TABLE publications_fts USING fts5(
+                title,
+                content='publications',
+                content_rowid='id',
+                tokenize='unicode61 remove_diacritics 2'
+            )
+        ''')
+
+        # Insert publications as the dump is streamed. Rows are generated on
+        # the fly into a single executemany, so memory stays flat.
+        publications_found = 0
+
+        def publication_rows(publications):
+            nonlocal publications_found
+            for pub_uri, title, authors in publications:
+                yield (pub_uri.decode('utf-8', 'replace'),
+                       title.decode('utf-8', 'replace') if title is not None else None,
+                       authors.decode('utf-8', 'replace'))
+
+                # Count a publication by its (single) title triple; split
+                # and title-less runs are merged or dropped later
+                if title is None:
+                    continue
+                publications_found += 1
+                if publications_found % 100000 == 0:
+                    print(f"  Inserted {publications_found:,} publications...")
+                    if on_progress:
+                        on_progress(triple_count, publications_found)
+
+        # A publication whose triples are split across runs (or shards) is
+        # inserted by its first run and extended by the later ones
+        insert_sql = f'''
+            INSERT INTO publications (uri, title, authors) VALUES (?, ?, ?)
+            ON CONFLICT (uri) DO UPDATE SET
+                title = coalesce(title, excluded.title),
+                authors = CASE
+                    WHEN excluded.authors = '' THEN authors
+                    WHEN authors = '' THEN excluded.authors
+                    ELSE authors || '{AUTHOR_SEPARATOR}' || excluded.authors
+                END
+        '''
+        if shards:
+            cur.executemany(insert_sql, publication_rows(
+                iter_publications_parallel(shards, workers, author_names)))
+        else:
+            with open_ntriples(ntriples_path) as f:
+                cur.executemany(insert_sql, publication_rows(
+                    iter_publications(f, author_names)))
 
-    cur.execute('''
-        CREATE VIRTUAL TABLE publications_fts USING fts5(
-            title,
-            content='publications',
-            content_rowid='id'
-        )
-    ''')
+    # Runs never joined by a title triple are not publications
+    cur.execute('DELETE FROM publications WHERE title IS NULL')
+    cur.execute('SELECT count(*) FROM publications')
+    publication_count = cur.fetchone()[0]
+    print(f"  Total: {publication_count:,} publications inserted")
 
     # Store metadata
     cur.execute('''
@@ -245,64 +590,19 @@ def build_sqlite_db(ntriples_path, db_path, on_progress=None):
     )
     cur.execute(
         'INSERT INTO metadata (key, value) VALUES (?, ?)',
-        ('publication_count', str(len(pub_titles)))
+        ('publication_count', str(publication_count))
+    )
+    cur.execute(
+        'INSERT INTO metadata (key, value) VALUES (?, ?)',
+        ('author_separator', AUTHOR_SEPARATOR)
     )
 
-    # Insert publications
-    insert_count = 0
-    batch = []
-    batch_size = 10000
-
-    for pub_uri, title in pub_titles.items():
-        # Resolve author names
-        author_uris = pub_authors.get(pub_uri, [])
-        names = []
-        for uri in author_uris:
-            name = author_names.get(uri)
-            if name:
-                names.append(name)
-
-        authors_str = "; ".join(names) if names else ""
-
-        # Use the publication URI as the URL (DBLP URIs are web-accessible)
-        url = pub_uri
-
-        batch.append((pub_uri, title, authors_str, url))
-
-        if len(batch) >= batch_size:
-            cur.executemany(
-                'INSERT INTO publications (uri, title, authors, url) VALUES (?, ?, ?, ?)',
-                batch
-            )
-            insert_count += len(batch)
-            batch = []
-
-            if insert_count % 100000 == 0:
-                print(f"  Inserted {insert_count:,} publications...")
-
-    # Insert remaining
-    if batch:
-        cur.executemany(
-            'INSERT INTO publications (uri, title, authors, url) VALUES (?, ?, ?, ?)',
-            batch
-        )
-        insert_count += len(batch)
-
-    print(f"  Total: {insert_count:,} publications inserted")
-
-    # Build FTS index
+    # Build FTS index in one go; 'rebuild' is FTS5's bulk path for
+    # external-content tables
     print("Building full-text search index...")
-    cur.execute('''
-        INSERT INTO publications_fts (rowid, title)
-        SELECT id, title FROM publications
-    ''')
-
-    conn.commit()
-
-    # Create regular index on title for exact matches
-    print("Creating indexes...")
-    cur.execute('CREATE INDEX idx_title ON publications(title)')
+    cur.execute("INSERT INTO publications_fts (publications_fts) VALUES ('rebuild')")
 
+    cur.execute('COMMIT')
     conn.close()
 
     elapsed = time.time() - start_time
@@ -367,6 +667,35 @@ def check_staleness(db_path):
     return None
 
 
+def _is_merged_compound(w):
+    """Return True for words that are likely several words run together.
+
+    Catches long words like "Crossprivilege" and long camelCase words like
+    "CrossPrivilege". Uses only str methods, as this runs for every word.
+    """
+    n = len(w)
+    if n > 12:
+        return True
+    # Lowercasing changes the tail only if it has an uppercase letter
+    return n > 10 and w[1:].lower() != w[1:]
+
+
+def _is_merged_acronym(w):
+    """Return True for all-caps words > 4 chars, e.g., "CFLAT", "SGXDUMP"."""
+    return len(w) > 4 and w.isupper()
+
+
+def _fts5_word_score(w, idx):
+    """Score a query word by distinctiveness; idx is its position."""
+    score = len(w)
+    if w[0].isupper():
+        score += 10  # Capitalized words are more distinctive
+    if w.isupper() and len(w) >= 3:
+        score += 5   # Valid acronyms get extra boost
+    score -= idx * 0.5  # Earlier position slightly preferred
+    return score
+
+
 def normalize_fts5_query(words):
     """Normalize words for FTS5 queries.
 
@@ -399,11 +728,7 @@ def normalize_fts5_query(words):
                 if lower not in seen:
                     seen.add(lower)
                     normalized.append(part)
-        elif len(w) > 12:
-            # Skip merged compounds like "Crossprivilege"
-            continue
-        elif len(w) > 10 and any(c.isupper() for c in w[1:]):
-            # Skip long camelCase words like "CrossPrivilege"
+        elif _is_merged_compound(w):
             continue
         else:
             lower = w.lower()
@@ -414,33 +739,143 @@ def normalize_fts5_query(words):
     if not normalized:
         return []
 
-    # Score words by distinctiveness
-    def word_score(w, idx):
-        score = len(w)
-        if w[0].isupper():
-            score += 10  # Capitalized words are more distinctive
-        if w.isupper() and len(w) >= 3:
-            score += 5   # Valid acronyms get extra boost
-        score -= idx * 0.5  # Earlier position slightly preferred
-        return score
-
-    scored = [(word_score(w, i), w) for i, w in enumerate(normalized)]
-    scored.sort(key=lambda x: -x[0])
-
-    # Select top words, skipping merged acronyms
-    top_words = []
-    for _, w in scored:
-        if len(top_words) >= 4:
-            break
-        # Skip merged acronyms (all-caps > 4 chars, e.g., "CFLAT", "SGXDUMP")
-        if w.isupper() and len(w) > 4:
-            continue
-        top_words.append(w)
+    # Select the 4 most distinctive words, skipping merged acronyms. Position
+    # counts in the normalized list, so it is scored before filtering.
+    scored = [
+        (_fts5_word_score(w, i), w)
+        for i, w in enumerate(normalized)
+        if not _is_merged_acronym(w)
+    ]
+    top_words = [w for _, w in heapq.nlargest(4, scored, key=itemgetter(0))]
 
     # Quote each word for FTS5 (prevents operator interpretation)
     return ['"' + w.replace('"', '""') + '"' for w in top_words]
 
 
+# Idle query connections per database, keyed by absolute path. Each entry is
+# (stamp, schema_version, author_separator, idle_connections); see
+# _query_connection().
+_query_connections = {}
+_query_connections_lock = threading.Lock()
+
+
+def _db_stamp(path):
+    """Identify the current file at path, so a rebuild is noticed.
+
+    A rebuild replaces the file (new inode) or at least rewrites it (new
+    mtime), possibly from another process such as --update-dblp.
+    """
+    st = os.stat(path)
+    return st.st_ino, st.st_mtime_ns
+
+
+def _open_query_connection(path):
+    """Open a query connection to path and read its storage format.
+
+    Returns (connection, schema_version, author_separator). author_separator
+    is None for databases that predate recording it, which join authors
+    with "; ".
+    """
+    # Connections are handed between (short-lived) executor threads, but only
+    # ever used by one thread at a time
+    conn = sqlite3.connect(path, check_same_thread=False)
+    conn.execute(f"PRAGMA mmap_size={QUERY_MMAP_SIZE}")
+
+    # Detect schema version and author separator
+    try:
+        meta = dict(conn.execute(
+            "SELECT key, value FROM metadata"
+            " WHERE key IN ('schema_version', 'author_separator')"
+        ).fetchall())
+    except Exception:
+        meta = {}
+    schema_version = int(meta.get('schema_version', 0))
+    return conn, schema_version, meta.get('author_separator')
+
+
+@contextmanager
+def _query_connection(db_path):
+    """Borrow a query connection to db_path.
+
+    Yields (connection, schema_version, author_separator), as returned by
+    _open_query_connection().
+
+    Connections are pooled rather than shared, so concurrent queries each get
+    their own, and reused across calls. If the file has been replaced or
+    rewritten since the pool's connections were opened, they are closed and
+    a fresh one is opened, so queries never read a stale database.
+    """
+    path = os.path.abspath(db_path)
+    stamp = _db_stamp(path)
+    with _query_connections_lock:
+        entry = _query_connections.get(path)
+        if entry is not None and entry[0] != stamp:
+            for stale in entry[3]:
+                stale.close()
+            del _query_connections[path]
+            entry = None
+        conn = entry[3].pop() if entry is not None and entry[3] else None
+
+    if conn is None:
+        conn, schema_version, author_separator = _open_query_connection(path)
+    else:
+        _, schema_version, author_separator, _ = entry
+
+    try:
+        yield conn, schema_version, author_separator
+    finally:
+        with _query_connections_lock:
+            entry = _query_connections.get(path)
+            if entry is None:
+                entry = _query_connections[path] = (
+                    stamp, schema_version, author_separator, [])
+            if entry[0] == stamp:
+                entry[3].append(conn)
+            else:
+                conn.close()
+
+
+def close_query_connection(db_path=None):
+    """Close the idle query connections for db_path, or all of them if None.
+
+    Connections in use at the time go back to the pool when released, and
+    are closed once a later query finds the database file has changed.
+    """
+    with _query_connections_lock:
+        if db_path is None:
+            paths = list(_query_connections)
+        else:
+            paths = [os.path.abspath(db_path)]
+        for path in paths:
+            entry = _query_connections.pop(path, None)
+            if entry is not None:
+                for conn in entry[3]:
+                    conn.close()
+
+
+def _fold_diacritics(text):
+    """Strip combining marks, e.g. "Über Müller" -> "Uber Muller"."""
+    return ''.join(
+        c for c in unicodedata.normalize('NFKD', text) if not unicodedata.combining(c)
+    )
+
+
+@lru_cache(maxsize=65536)
+def _normalized_title(title):
+    """Memoized normalize_title(); candidate titles recur across queries."""
+    from check_hallucinated_references import normalize_title
+    return normalize_title(title)
+
+
+@lru_cache(maxsize=65536)
+def _query_words(title):
+    """Memoized get_query_words() over the diacritic-folded title."""
+    from check_hallucinated_references import get_query_words
+    # The index folds diacritics, so fold them in the query too rather than
+    # letting "Über" become the word "ber".
+    return tuple(get_query_words(_fold_diacritics(title), 6))
+
+
 def query_offline(title, db_path):
     """Query the offline DBLP database for a title.
 
@@ -456,82 +891,74 @@ def query_offline(title, db_path):
     if not os.path.exists(db_path):
         raise FileNotFoundError(f"DBLP database not found: {db_path}")
 
-    # Import here to avoid circular dependency
-    from check_hallucinated_references import normalize_title, get_query_words
-    from rapidfuzz import fuzz
-
-    conn = sqlite3.connect(db_path)
-    cur = conn.cursor()
-
-    # Detect schema version
-    try:
-        cur.execute("SELECT value FROM metadata WHERE key = 'schema_version'")
-        row = cur.fetchone()
-        schema_version = int(row[0]) if row else 0
-    except Exception:
-        schema_version = 0
+    from rapidfuzz import fuzz, process
 
     # Use FTS to find candidates
-    words = get_query_words(title, 6)
+    words = _query_words(title)
     if not words:
-        conn.close()
         return None, [], None
 
     # Normalize words for FTS5 query
     quoted_words = normalize_fts5_query(words)
     if not quoted_words:
-        conn.close()
         return None, [], None
 
     query = ' '.join(quoted_words)
 
-    # Query based on schema version
-    if schema_version >= 3:
-        # Rust schema v3: normalized authors
-        cur.execute('''
-            SELECT p.id, p.key, p.title
-            FROM publications p
-            WHERE p.id IN (SELECT rowid FROM publications_fts WHERE title MATCH ?)
-            LIMIT 20
-        ''', (query,))
-        results = cur.fetchall()
-    else:
-        # Legacy Python schema: denormalized authors
-        cur.execute('''
-            SELECT p.id, p.uri, p.title, p.authors, p.url
-            FROM publications p
-            WHERE p.id IN (SELECT rowid FROM publications_fts WHERE title MATCH ?)
-            LIMIT 20
-        ''', (query,))
-        results = cur.fetchall()
+    with _query_connection(db_path) as (conn, schema_version, author_separator):
+        cur = conn.cursor()
 
-    # Find best fuzzy match
-    normalized_input = normalize_title(title)
+        # Query based on schema version
+        if schema_version >= 3:
+            # Rust schema v3: normalized authors
+            cur.execute('''
+                SELECT p.id, p.key, p.title
+                FROM publications p
+                WHERE p.id IN (SELECT rowid FROM publications_fts WHERE title MATCH ?)
+                LIMIT 20
+            ''', (query,))
+            results = cur.fetchall()
+        else:
+            # Legacy Python schema: denormalized authors
+            cur.execute('''
+                SELECT p.id, p.uri, p.title, p.authors, p.url
+                FROM publications p
+                WHERE p.id IN (SELECT rowid FROM publications_fts WHERE title MATCH ?)
+                LIMIT 20
+            ''', (query,))
+            results = cur.fetchall()
+
+        # Find best fuzzy match, scoring all candidates in one call
+        match = process.extractOne(
+            _normalized_title(title),
+            [_normalized_title(row[2]) for row in results],
+            scorer=fuzz.ratio,
+            score_cutoff=95,
+        )
+        if match is None:
+            return None, [], None
+        row = results[match[2]]
 
-    for row in results:
         if schema_version >= 3:
             pub_id, key, found_title = row
-            if fuzz.ratio(normalized_input, normalize_title(found_title)) >= 95:
-                # Fetch authors via JOIN
-                cur.execute('''
-                    SELECT a.name FROM authors a
-                    JOIN publication_authors pa ON a.id = pa.author_id
-                    WHERE pa.pub_id = ?
-                ''', (pub_id,))
-                authors = [a[0] for a in cur.fetchall()]
-                url = f"https://dblp.org/rec/{key}"
-                conn.close()
-                return found_title, authors, url
+            # Fetch authors via JOIN
+            cur.execute('''
+                SELECT a.name FROM authors a
+                JOIN publication_authors pa ON a.id = pa.author_id
+                WHERE pa.pub_id = ?
+            ''', (pub_id,))
+            authors = [a[0] for a in cur.fetchall()]
+            url = f"https://dblp.org/rec/{key}"
         else:
             pub_id, uri, found_title, authors_str, url = row
-            if fuzz.ratio(normalized_input, normalize_title(found_title)) >= 95:
-                # Parse authors string back to list
+            # Parse authors string back to list
+            if author_separator is not None:
+                authors = authors_str.split(author_separator) if authors_str else []
+            else:
+                # Built before the separator was recorded: "a; b"
                 authors = [a.strip() for a in authors_str.split(';') if a.strip()]
-                conn.close()
-                return found_title, authors, url
 
-    conn.close()
-    return None, [], None
+    return found_title, authors, url
 
 
 def update_dblp_db(db_path, keep_download=False):
@@ -544,8 +971,6 @@ def update_dblp_db(db_path, keep_download=False):
     Returns:
         Path to built database
     """
-    import tempfile
-
     # Download to temp location
     db_dir = os.path.dirname(db_path) or '.'
     os.makedirs(db_dir, exist_ok=True)
@@ -1,13 +1,19 @@
 """Tests for dblp_offline.py functions."""
 
+import gzip
 import pytest
 import tempfile
 import os
 import sqlite3
 from datetime import datetime, timezone, timedelta
 
+import dblp_offline
 from dblp_offline import (
     parse_ntriples_line,
+    build_sqlite_db,
+    normalize_fts5_query,
+    query_offline,
+    close_query_connection,
     get_db_metadata,
     get_db_age_days,
     check_staleness,
@@ -74,6 +80,12 @@ class TestParseNtriplesLine:
         subj, pred, obj = parse_ntriples_line(line)
         assert obj == r"Path\file"
 
+    def test_parse_escaped_backslash_before_n(self):
+        """Test that an escaped backslash followed by 'n' is not read as a newline."""
+        line = r'<http://example.org/s> <http://example.org/p> "C:\\new" .'
+        subj, pred, obj = parse_ntriples_line(line)
+        assert obj == r"C:\new"
+
     def test_parse_empty_line(self):
         """Test parsing empty line."""
         subj, pred, obj = parse_ntriples_line("")
@@ -118,6 +130,210 @@ class TestParseNtriplesLine:
         subj, pred, obj = parse_ntriples_line(line)
         assert subj is None
 
+    def test_parse_bytes_line(self):
+        """Test parsing a raw bytes line returns bytes parts."""
+        line = '<https://dblp.org/pid/1/2> <http://example.org/p> "M\u00fcller \\"Jr\\"" .\n'.encode('utf-8')
+        subj, pred, obj = parse_ntriples_line(line)
+        assert subj == b"https://dblp.org/pid/1/2"
+        assert pred == b"http://example.org/p"
+        assert obj == 'M\u00fcller "Jr"'.encode('utf-8')
+
+
+SAMPLE_DUMP = f"""\
+<https://dblp.org/rec/conf/acl/SmithJ23> <{DBLP_TITLE}> "Deep Learning for NLP" .
+<https://dblp.org/rec/conf/acl/SmithJ23> <{DBLP_AUTHORED_BY}> <https://dblp.org/pid/1/1> .
+<https://dblp.org/rec/conf/acl/SmithJ23> <{DBLP_AUTHORED_BY}> <https://dblp.org/pid/2/2> .
+<https://dblp.org/rec/conf/acl/SmithJ23> <http://www.w3.org/1999/02/22-rdf-syntax-ns#type> <https://dblp.org/rdf/schema#Inproceedings> .
+<https://dblp.org/rec/journals/x/Muller24> <{DBLP_TITLE}> "\u00dcber \\"Graphs\\"" .
+<https://dblp.org/rec/journals/x/Muller24> <{DBLP_AUTHORED_BY}> <https://dblp.org/pid/2/2> .
+<https://dblp.org/pid/1/1> <{DBLP_PRIMARY_NAME}> "John Smith" .
+<https://dblp.org/pid/2/2> <{DBLP_PRIMARY_NAME}> "J\u00fcrgen M\u00fcller" .
+"""
+
+
+class TestBuildSqliteDb:
+    """Tests for building the SQLite database from an N-Triples dump."""
+
+    @pytest.fixture(params=[
+        ("dblp.nt.gz", 1),
+        ("dblp.nt", 1),
+        ("dblp.nt.gz", 2),
+        ("dblp.nt", 2),
+    ], ids=lambda p: f"{p[0]}-workers{p[1]}")
+    def built_db(self, request, tmp_path, monkeypatch):
+        filename, workers = request.param
+        if workers > 1 and filename.endswith('.gz') and dblp_offline.rapidgzip is None:
+            pytest.skip("parallel scan of gzipped dumps needs rapidgzip")
+        # Tiny shards so that shard boundaries fall inside lines and between
+        # a publication's triples
+        monkeypatch.setattr(dblp_offline, 'SHARD_SIZE', 300)
+
+        nt_path = tmp_path / filename
+        opener = gzip.open if filename.endswith('.gz') else open
+        with opener(nt_path, 'wt', encoding='utf-8') as f:
+            f.write(SAMPLE_DUMP)
+        db_path = tmp_path / "dblp.db"
+        build_sqlite_db(str(nt_path), str(db_path), workers=workers)
+        conn = sqlite3.connect(db_path)
+        yield conn
+        conn.close()
+
+    def test_publications_inserted(self, built_db):
+        """Test that every titled publication gets a row with resolved authors."""
+        rows = built_db.execute(
+            'SELECT uri, title, authors, url FROM publications ORDER BY uri'
+        ).fetchall()
+        assert rows == [
+            ("https://dblp.org/rec/conf/acl/SmithJ23", "Deep Learning for NLP",
+             "John Smith\x1fJ\u00fcrgen M\u00fcller", "https://dblp.org/rec/conf/acl/SmithJ23"),
+            ("https://dblp.org/rec/journals/x/Muller24", '\u00dcber "Graphs"',
+             "J\u00fcrgen M\u00fcller", "https://dblp.org/rec/journals/x/Muller24"),
+        ]
+
+    def test_fts_index_populated(self, built_db):
+        """Test that the full-text index finds publications by title words."""
+        rows = built_db.execute(
+            "SELECT rowid FROM publications_fts WHERE title MATCH '\"learning\"'"
+        ).fetchall()
+        assert len(rows) == 1
+
+    def test_split_publication_merged(self, tmp_path):
+        """Test that a publication's triples need not be contiguous in the dump."""
+        lines = SAMPLE_DUMP.splitlines(keepends=True)
+        # Move Smith's second author after Muller's triples and add an
+        # authorship for a record that has no title
+        dump = "".join(lines[:2] + lines[3:6] + lines[2:3] + lines[6:]) + (
+            f"<https://dblp.org/rec/x/NoTitle> <{DBLP_AUTHORED_BY}> <https://dblp.org/pid/1/1> .\n"
+        )
+        nt_path = tmp_path / "dblp.nt"
+        nt_path.write_text(dump, encoding='utf-8')
+        db_path = tmp_path / "dblp.db"
+        build_sqlite_db(str(nt_path), str(db_path), workers=1)
+
+        conn = sqlite3.connect(db_path)
+        rows = conn.execute('SELECT uri, authors FROM publications ORDER BY uri').fetchall()
+        count = conn.execute(
+            "SELECT value FROM metadata WHERE key = 'publication_count'"
+        ).fetchone()[0]
+        conn.close()
+        assert rows == [
+            ("https://dblp.org/rec/conf/acl/SmithJ23", "John Smith\x1fJ\u00fcrgen M\u00fcller"),
+            ("https://dblp.org/rec/journals/x/Muller24", "J\u00fcrgen M\u00fcller"),
+        ]
+        assert count == '2'
+
+    def test_metadata_written(self, built_db):
+        """Test that build metadata is recorded."""
+        meta = dict(built_db.execute('SELECT key, value FROM metadata').fetchall())
+        assert meta['publication_count'] == '2'
+        assert meta['author_separator'] == '\x1f'
+        assert 'build_date' in meta
+
+
+class TestNormalizeFts5Query:
+    """Tests for building FTS5 query terms from title words."""
+
+    def test_terms_are_quoted(self):
+        """Test that selected words are quoted for FTS5."""
+        assert normalize_fts5_query(["Graph"]) == ['"Graph"']
+
+    def test_merged_compounds_skipped(self):
+        """Test that long and long camelCase words are dropped."""
+        terms = normalize_fts5_query(["Crossprivilegeattack", "CrossPrivilege", "Crossovers", "attack"])
+        assert terms == ['"Crossovers"', '"attack"']
+
+    def test_merged_acronyms_skipped(self):
+        """Test that all-caps words > 4 chars are dropped but short acronyms kept."""
+        terms = normalize_fts5_query(["SGXDUMP", "BERT", "models"])
+        assert terms == ['"BERT"', '"models"']
+
+    def test_hyphenated_words_split(self):
+        """Test that hyphenated words contribute their valid parts."""
+        terms = normalize_fts5_query(["Self-Supervised", "learning?"])
+        assert sorted(terms) == ['"Self"', '"Supervised"', '"learning"']
+
+    def test_at_most_four_terms(self):
+        """Test that only the four most distinctive words are kept."""
+        terms = normalize_fts5_query(["alpha", "Beta", "gamma", "Delta", "epsilon", "Zeta"])
+        assert terms == ['"Beta"', '"Delta"', '"Zeta"', '"alpha"']
+
+
+class TestQueryOffline:
+    """Tests for title lookups against a built database."""
+
+    @pytest.fixture
+    def db_path(self, tmp_path):
+        nt_path = tmp_path / "dblp.nt"
+        nt_path.write_text(SAMPLE_DUMP, encoding='utf-8')
+        db_path = tmp_path / "dblp.db"
+        build_sqlite_db(str(nt_path), str(db_path), workers=1)
+        yield str(db_path)
+        close_query_connection()
+
+    def test_close_match_found(self, db_path):
+        """Test that a title differing only in punctuation is matched."""
+        title, authors, url = query_offline("Deep learning for NLP.", db_path)
+        assert title == "Deep Learning for NLP"
+        assert authors == ["John Smith", "J\u00fcrgen M\u00fcller"]
+        assert url == "https://dblp.org/rec/conf/acl/SmithJ23"
+
+    def test_old_author_separator_read(self, db_path):
+        """Test that databases storing authors as "a; b" are still read."""
+        conn = sqlite3.connect(db_path)
+        conn.execute("UPDATE publications SET authors = replace(authors, char(31), '; ')")
+        conn.execute("DELETE FROM metadata WHERE key = 'author_separator'")
+        conn.commit()
+        conn.close()
+        _, authors, _ = query_offline("Deep Learning for NLP", db_path)
+        assert authors == ["John Smith", "J\u00fcrgen M\u00fcller"]
+
+    def test_single_author_with_semicolon_kept(self, db_path):
+        """Test that a lone author name is not split on ";" in new databases."""
+        conn = sqlite3.connect(db_path)
+        conn.execute("UPDATE publications SET authors = 'Smith; Jr.' WHERE title = 'Deep Learning for NLP'")
+        conn.commit()
+        conn.close()
+        _, authors, _ = query_offline("Deep Learning for NLP", db_path)
+        assert authors == ["Smith; Jr."]
+
+    def test_diacritics_folded(self, db_path):
+        """Test that titles match with or without diacritics."""
+        for query in ("Über Graphs", "Uber Graphs"):
+            title, _, _ = query_offline(query, db_path)
+            assert title == '\u00dcber "Graphs"'
+
+    def test_dissimilar_title_not_matched(self, db_path):
+        """Test that a title with no close match returns nothing."""
+        assert query_offline("Deep Learning for Vision", db_path) == (None, [], None)
+
+    def test_rebuild_invalidates_cached_connection(self, db_path, tmp_path):
+        """Test that queries see a database rebuilt at the same path."""
+        assert query_offline("Deep Learning for NLP", db_path)[0] is not None
+        nt_path = tmp_path / "other.nt"
+        nt_path.write_text(SAMPLE_DUMP.replace("Deep Learning", "Shallow Learning"),
+                           encoding='utf-8')
+        build_sqlite_db(str(nt_path), db_path, workers=1)
+        assert query_offline("Deep Learning for NLP", db_path) == (None, [], None)
+        assert query_offline("Shallow Learning for NLP", db_path)[0] == "Shallow Learning for NLP"
+
+    def test_external_rebuild_invalidates_cached_connection(self, db_path, tmp_path):
+        """Test that queries see a database replaced without close_query_connection."""
+        assert query_offline("Deep Learning for NLP", db_path)[0] is not None
+        # Stands in for --update-dblp running in another process
+        nt_path = tmp_path / "other.nt"
+        nt_path.write_text(SAMPLE_DUMP.replace("Deep Learning", "Shallow Learning"),
+                           encoding='utf-8')
+        new_db_path = tmp_path / "new.db"
+        build_sqlite_db(str(nt_path), str(new_db_path), workers=1)
+        os.replace(new_db_path, db_path)
+        assert query_offline("Deep Learning for NLP", db_path) == (None, [], None)
+        assert query_offline("Shallow Learning for NLP", db_path)[0] == "Shallow Learning for NLP"
+
+    def test_missing_db_raises(self, tmp_path):
+        """Test that a missing database file is reported."""
+        with pytest.raises(FileNotFoundError):
+            query_offline("Anything", str(tmp_path / "missing.db"))
+
 
 class TestGetDbMetadata:
     """Tests for database metadata retrieval."""